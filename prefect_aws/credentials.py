@@ -35,6 +35,10 @@ def _get_client_cached(ctx, client_type: Union[str, ClientType]) -> Any:
     """
     Helper method to cache and dynamically get a client type.
 
+    Clients are cached per credentials block and client type. At most 8 clients are
+    kept; the least recently used client is evicted first. Client creation is
+    serialized with a lock since boto3 sessions are not thread-safe.
+
     Args:
         client_type: The client's service name.
 
@@ -44,13 +48,15 @@ def _get_client_cached(ctx, client_type: Union[str, ClientType]) -> Any:
     Raises:
         ValueError: if the client is not supported.
     """
-    with _LOCK:
-        if isinstance(client_type, ClientType):
-            client_type = client_type.value
+    if isinstance(client_type, ClientType):
+        client_type = client_type.value
+
+    params_override = ctx.aws_client_parameters.get_params_override()
 
+    with _LOCK:
         client = ctx.get_boto3_session().client(
             service_name=client_type,
-            **ctx.aws_client_parameters.get_params_override(),
+            **params_override,
         )
     return client
 
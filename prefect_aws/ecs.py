@@ -120,9 +120,9 @@ import shlex
 import sys
 import time
 import warnings
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any, Dict, Generator, List, Optional, Tuple, Union
 
-import boto3
 import yaml
 from anyio.abc import TaskStatus
 from jsonpointer import JsonPointerException
@@ -146,7 +146,14 @@ from slugify import slugify
 from typing_extensions import Literal, Self
 
 from prefect_aws import AwsCredentials
-from prefect_aws.workers.ecs_worker import _TAG_REGEX, ECSWorker
+from prefect_aws.credentials import ClientType
+from prefect_aws.workers.ecs_worker import (
+    _TAG_REGEX,
+    ECSWorker,
+    _json_deepcopy,
+    _task_definition_dicts_equal,
+    _task_definition_with_aws_defaults,
+)
 
 # Internal type alias for ECS clients which are generated dynamically in botocore
 _ECSClient = Any
@@ -175,6 +182,9 @@ POST_REGISTRATION_FIELDS = [
     "registeredBy",
     "deregisteredAt",
 ]
+# Set form of POST_REGISTRATION_FIELDS for membership checks
+_POST_REGISTRATION_FIELD_SET = frozenset(POST_REGISTRATION_FIELDS)
+_FAMILY_REGEX = r"[^a-zA-Z0-9-_]+"
 
 
 def get_prefect_container(containers: List[dict]) -> Optional[dict]:
@@ -205,6 +215,20 @@ def parse_task_identifier(identifier: str) -> Tuple[str, str]:
     return cluster, task
 
 
+@lru_cache(maxsize=256)
+def _slugify_family(family: str) -> str:
+    """
+    Slugify a task definition family name.
+
+    Tasks see the same few families over and over, so results are cached.
+    """
+    return slugify(
+        family,
+        max_length=255,
+        regex_pattern=_FAMILY_REGEX,
+    )
+
+
 def _pretty_diff(d1: dict, d2: dict) -> str:
     """
     Return a string with a pretty printed difference between two dictionaries.
@@ -229,7 +253,8 @@ class ECSTask(Infrastructure):
     Attributes:
         type: The slug for this task type with a default value of "ecs-task".
         aws_credentials: The AWS credentials to use to connect to ECS with a
-            default factory of AwsCredentials.
+            default factory of AwsCredentials. Their client parameters, such as
+            `endpoint_url`, apply to the ECS, EC2, and CloudWatch Logs clients.
         task_definition_arn: An optional identifier for an existing task definition
             to use. If fields are set on the ECSTask that conflict with the task
             definition, a new copy will be registered with the required values.
@@ -637,9 +662,7 @@ class ECSTask(Infrastructure):
         """
         Run the configured task on ECS.
         """
-        boto_session, ecs_client = await run_sync_in_worker_thread(
-            self._get_session_and_client
-        )
+        ecs_client = await run_sync_in_worker_thread(self._get_client)
 
         (
             task_arn,
@@ -647,7 +670,7 @@ class ECSTask(Infrastructure):
             task_definition,
             is_new_task_definition,
         ) = await run_sync_in_worker_thread(
-            self._create_task_and_wait_for_start, boto_session, ecs_client
+            self._create_task_and_wait_for_start, ecs_client
         )
 
         # Display a nice message indicating the command and image
@@ -674,7 +697,6 @@ class ECSTask(Infrastructure):
             cluster_arn,
             task_definition,
             is_new_task_definition and self.auto_deregister_task_definition,
-            boto_session,
             ecs_client,
         )
 
@@ -800,7 +822,7 @@ class ECSTask(Infrastructure):
                 f"{cluster!r}."
             )
 
-        _, ecs_client = self._get_session_and_client()
+        ecs_client = self._get_client()
         try:
             ecs_client.stop_task(cluster=cluster, task=task)
         except Exception as exc:
@@ -834,16 +856,17 @@ class ECSTask(Infrastructure):
         else:
             return "ECSTask"
 
-    def _get_session_and_client(self) -> Tuple[boto3.Session, _ECSClient]:
+    def _get_client(self) -> _ECSClient:
         """
-        Retrieve a boto3 session and ECS client
+        Retrieve an ECS client
+
+        The ECS client is shared between runs with the same credentials and, like the
+        EC2 and CloudWatch Logs clients, is configured by their client parameters.
         """
-        boto_session = self.aws_credentials.get_boto3_session()
-        ecs_client = boto_session.client("ecs")
-        return boto_session, ecs_client
+        return self.aws_credentials.get_client(ClientType.ECS)
 
     def _create_task_and_wait_for_start(
-        self, boto_session: boto3.Session, ecs_client: _ECSClient
+        self, ecs_client: _ECSClient
     ) -> Tuple[str, str, dict, bool]:
         """
         Register the task definition, create the task run, and wait for it to start.
@@ -891,17 +914,19 @@ class ECSTask(Infrastructure):
                             else ""
                         )
                     )
-                    self.logger.debug(
-                        f"{self._log_prefix}: Diff for requested task definition"
-                        + _pretty_diff(requested_task_definition, task_definition)
-                    )
+                    if self.logger.isEnabledFor(logging.DEBUG):
+                        self.logger.debug(
+                            f"{self._log_prefix}: Diff for requested task definition"
+                            + _pretty_diff(requested_task_definition, task_definition)
+                        )
                 else:
                     self.logger.info(
                         f"{self._log_prefix}: Registering task definition..."
                     )
-                    self.logger.debug(
-                        "Task definition payload\n" + yaml.dump(task_definition)
-                    )
+                    if self.logger.isEnabledFor(logging.DEBUG):
+                        self.logger.debug(
+                            "Task definition payload\n" + yaml.dump(task_definition)
+                        )
 
                 task_definition_arn = self._register_task_definition(
                     ecs_client, task_definition
@@ -909,7 +934,7 @@ class ECSTask(Infrastructure):
                 new_task_definition_registered = True
 
         if task_definition.get("networkMode") == "awsvpc":
-            network_config = self._load_vpc_network_config(self.vpc_id, boto_session)
+            network_config = self._load_vpc_network_config(self.vpc_id)
         else:
             network_config = None
 
@@ -918,7 +943,8 @@ class ECSTask(Infrastructure):
             task_definition_arn=task_definition_arn,
         )
         self.logger.info(f"{self._log_prefix}: Creating task run...")
-        self.logger.debug("Task run payload\n" + yaml.dump(task_run))
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Task run payload\n" + yaml.dump(task_run))
 
         try:
             task = self._run_task(ecs_client, task_run)
@@ -941,7 +967,6 @@ class ECSTask(Infrastructure):
         cluster_arn: str,
         task_definition: dict,
         deregister_task_definition: bool,
-        boto_session: boto3.Session,
         ecs_client: _ECSClient,
     ) -> Optional[int]:
         """
@@ -951,7 +976,7 @@ class ECSTask(Infrastructure):
 
         # Wait for completion and stream logs
         task = self._wait_for_task_finish(
-            task_arn, cluster_arn, task_definition, ecs_client, boto_session
+            task_arn, cluster_arn, task_definition, ecs_client
         )
 
         if deregister_task_definition:
@@ -982,44 +1007,11 @@ class ECSTask(Infrastructure):
         if taskdef_1 is None or taskdef_2 is None:
             return False
 
-        taskdef_1 = copy.deepcopy(taskdef_1)
-        taskdef_2 = copy.deepcopy(taskdef_2)
-
-        def _set_aws_defaults(taskdef):
-            """Set defaults that AWS would set after registration"""
-            container_definitions = taskdef.get("containerDefinitions", [])
-            essential = any(
-                container.get("essential") for container in container_definitions
-            )
-            if not essential:
-                container_definitions[0].setdefault("essential", True)
-
-            taskdef.setdefault("networkMode", "bridge")
-
-        _set_aws_defaults(taskdef_1)
-        _set_aws_defaults(taskdef_2)
-
-        def _drop_empty_keys(dict_):
-            """Recursively drop keys with 'empty' values"""
-            for key, value in tuple(dict_.items()):
-                if not value:
-                    dict_.pop(key)
-                if isinstance(value, dict):
-                    _drop_empty_keys(value)
-                if isinstance(value, list):
-                    for v in value:
-                        if isinstance(v, dict):
-                            _drop_empty_keys(v)
-
-        _drop_empty_keys(taskdef_1)
-        _drop_empty_keys(taskdef_2)
-
-        # Clear fields that change on registration for comparison
-        for field in POST_REGISTRATION_FIELDS:
-            taskdef_1.pop(field, None)
-            taskdef_2.pop(field, None)
-
-        return taskdef_1 == taskdef_2
+        return _task_definition_dicts_equal(
+            _task_definition_with_aws_defaults(taskdef_1),
+            _task_definition_with_aws_defaults(taskdef_2),
+            ignored_keys=_POST_REGISTRATION_FIELD_SET,
+        )
 
     def preview(self) -> str:
         """
@@ -1192,7 +1184,6 @@ class ECSTask(Infrastructure):
         cluster_arn: str,
         task_definition: dict,
         ecs_client: _ECSClient,
-        boto_session: boto3.Session,
     ):
         """
         Watch an ECS task until it reaches a STOPPED status.
@@ -1226,7 +1217,7 @@ class ECSTask(Infrastructure):
             else:
                 # Prepare to stream the output
                 log_config = container_def["logConfiguration"]["options"]
-                logs_client = boto_session.client("logs")
+                logs_client = self.aws_credentials.get_client("logs")
                 can_stream_output = True
                 # Track the last log timestamp to prevent double display
                 last_log_timestamp: Optional[int] = None
@@ -1361,11 +1352,14 @@ class ECSTask(Infrastructure):
         """
         # TODO: Consider including a global cache for this task definition since
         #       registration of task definitions is frequently rate limited
-        task_definition_request = copy.deepcopy(task_definition)
 
-        # We need to remove some fields here if copying an existing task definition
-        for field in POST_REGISTRATION_FIELDS:
-            task_definition_request.pop(field, None)
+        # We need to remove some fields here if copying an existing task definition;
+        # only top-level keys are removed so a shallow copy is sufficient
+        task_definition_request = {
+            key: value
+            for key, value in task_definition.items()
+            if key not in _POST_REGISTRATION_FIELD_SET
+        }
 
         response = ecs_client.register_task_definition(**task_definition_request)
         return response["taskDefinition"]["taskDefinitionArn"]
@@ -1374,7 +1368,7 @@ class ECSTask(Infrastructure):
         """
         Prepare a task definition by inferring any defaults and merging overrides.
         """
-        task_definition = copy.deepcopy(task_definition)
+        task_definition = _json_deepcopy(task_definition)
 
         # Configure the Prefect runtime container
         task_definition.setdefault("containerDefinitions", [])
@@ -1388,9 +1382,12 @@ class ECSTask(Infrastructure):
 
         # Remove any keys that have been explicitly "unset"
         unset_keys = {key for key, value in self.env.items() if value is None}
-        for item in tuple(container.get("environment", [])):
-            if item["name"] in unset_keys:
-                container["environment"].remove(item)
+        if container.get("environment"):
+            container["environment"] = [
+                item
+                for item in container["environment"]
+                if item["name"] not in unset_keys
+            ]
 
         if self.configure_cloudwatch_logs:
             container["logConfiguration"] = {
@@ -1405,11 +1402,7 @@ class ECSTask(Infrastructure):
             }
 
         family = self.family or task_definition.get("family") or ECS_DEFAULT_FAMILY
-        task_definition["family"] = slugify(
-            family,
-            max_length=255,
-            regex_pattern=r"[^a-zA-Z0-9-_]+",
-        )
+        task_definition["family"] = _slugify_family(family)
 
         # CPU and memory are required in some cases, retrieve the value to use
         cpu = self.cpu or task_definition.get("cpu") or ECS_DEFAULT_CPU
@@ -1498,14 +1491,12 @@ class ECSTask(Infrastructure):
 
         return overrides
 
-    def _load_vpc_network_config(
-        self, vpc_id: Optional[str], boto_session: boto3.Session
-    ) -> dict:
+    def _load_vpc_network_config(self, vpc_id: Optional[str]) -> dict:
         """
         Load settings from a specific VPC or the default VPC and generate a task
         run request's network configuration.
         """
-        ec2_client = boto_session.client("ec2")
+        ec2_client = self.aws_credentials.get_client("ec2")
         vpc_message = "the default VPC" if not vpc_id else f"VPC with ID {vpc_id}"
 
         if not vpc_id:
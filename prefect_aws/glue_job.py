@@ -2,10 +2,13 @@
 Integrations with the AWS Glue Job.
 
 """
-import time
-from typing import Any, Optional
+import random
+from typing import Any, ClassVar, FrozenSet, Optional
 
+import anyio
+from botocore.exceptions import ClientError, EndpointConnectionError
 from prefect.blocks.abstract import JobBlock, JobRun
+from prefect.utilities.asyncutils import run_sync_in_worker_thread, sync_compatible
 from pydantic import VERSION as PYDANTIC_VERSION
 
 if PYDANTIC_VERSION.startswith("2."):
@@ -17,6 +20,14 @@ from prefect_aws import AwsCredentials
 
 _GlueJobClient = Any
 
+# Error codes returned by AWS when API calls are throttled
+_THROTTLING_ERROR_CODES = frozenset(
+    {"Throttling", "ThrottlingException", "TooManyRequestsException"}
+)
+
+# Consecutive polls of a job run that may be retried after a transient error
+_MAX_POLL_RETRIES = 5
+
 
 class GlueJobRun(JobRun, BaseModel):
     """Execute a Glue Job"""
@@ -41,7 +52,18 @@ class GlueJobRun(JobRun, BaseModel):
         ),
     )
 
-    _error_states = ["FAILED", "STOPPED", "ERROR", "TIMEOUT"]
+    job_watch_min_poll_interval: float = Field(
+        default=2.0,
+        description=(
+            "The amount of time to wait between the first AWS API calls after the "
+            "state of the Glue Job changes. The wait grows towards "
+            "`job_watch_poll_interval` while the state stays the same."
+        ),
+    )
+
+    _error_states: ClassVar[FrozenSet[str]] = frozenset(
+        {"FAILED", "STOPPED", "ERROR", "TIMEOUT"}
+    )
 
     aws_credentials: AwsCredentials = Field(
         title="AWS Credentials",
@@ -56,14 +78,59 @@ class GlueJobRun(JobRun, BaseModel):
         job = self._get_job_run()
         return job["JobRun"]["JobRunState"]
 
-    def wait_for_completion(self) -> None:
+    @sync_compatible
+    async def wait_for_completion(self) -> None:
         """
         Wait for the job run to complete and get exit code
+
+        Only the AWS API calls run in a worker thread; no thread is held while waiting
+        between polls. Polls start out frequent after each state change and back off
+        exponentially towards `job_watch_poll_interval`. Throttled polls and connection
+        errors are retried up to five times in a row before the error is raised.
+
+        When called from an async context this returns a coroutine that must be
+        awaited; the job run is not watched until it is. Synchronous callers still
+        block until the job run completes.
         """
         self.logger.info(f"watching job {self.job_name} with run id {self.job_id}")
+        min_poll_interval = min(
+            self.job_watch_min_poll_interval, self.job_watch_poll_interval
+        )
+        poll_interval = min_poll_interval
+        last_job_state = None
+        poll_retries = 0
         while True:
-            job = self._get_job_run()
+            try:
+                job = await run_sync_in_worker_thread(self._get_job_run)
+            except (ClientError, EndpointConnectionError) as exc:
+                # The job is still running; wait out throttling and connection errors
+                # for a few polls instead of failing
+                if (
+                    isinstance(exc, ClientError)
+                    and exc.response.get("Error", {}).get("Code")
+                    not in _THROTTLING_ERROR_CODES
+                ):
+                    raise
+                if poll_retries >= _MAX_POLL_RETRIES:
+                    raise
+                poll_retries += 1
+                self.logger.warning(
+                    "failed to poll job %s, retrying (%d/%d): %s",
+                    self.job_name,
+                    poll_retries,
+                    _MAX_POLL_RETRIES,
+                    exc,
+                )
+                await anyio.sleep(poll_interval + random.uniform(1, 5))
+                poll_interval = min(poll_interval * 1.5, self.job_watch_poll_interval)
+                continue
+            poll_retries = 0
+
             job_state = job["JobRun"]["JobRunState"]
+            if job_state != last_job_state:
+                poll_interval = min_poll_interval
+                last_job_state = job_state
+
             if job_state in self._error_states:
                 # Generate a dynamic exception type from the AWS name
                 self.logger.error(f"job failed: {job['JobRun']['ErrorMessage']}")
@@ -72,7 +139,8 @@ class GlueJobRun(JobRun, BaseModel):
                 self.logger.info(f"job succeeded: {self.job_id}")
                 break
 
-            time.sleep(self.job_watch_poll_interval)
+            await anyio.sleep(poll_interval)
+            poll_interval = min(poll_interval * 1.5, self.job_watch_poll_interval)
 
     def _get_job_run(self):
         """get glue job"""
@@ -98,30 +166,35 @@ class GlueJobBlock(JobBlock):
             default is 60s because of jobs that use AWS Glue versions 2.0 and later
             have a 1-minute minimum.
             [AWS Glue Pricing](https://aws.amazon.com/glue/pricing/?nc1=h_ls)
+        job_watch_min_poll_interval: The amount of time to wait between the first AWS
+            API calls after the state of a Glue Job changes. The wait grows towards
+            `job_watch_poll_interval` while the state stays the same.
 
     Example:
         Start a job to AWS Glue Job.
         ```python
+        import asyncio
+
         from prefect import flow
         from prefect_aws import AwsCredentials
         from prefect_aws.glue_job import GlueJobBlock
 
 
         @flow
-        def example_run_glue_job():
+        async def example_run_glue_job():
             aws_credentials = AwsCredentials(
                 aws_access_key_id="your_access_key_id",
                 aws_secret_access_key="your_secret_access_key"
             )
-            glue_job_run = GlueJobBlock(
+            glue_job_run = await GlueJobBlock(
                 job_name="your_glue_job_name",
                 arguments={"--YOUR_EXTRA_ARGUMENT": "YOUR_EXTRA_ARGUMENT_VALUE"},
             ).trigger()
 
-            return glue_job_run.wait_for_completion()
+            return await glue_job_run.wait_for_completion()
 
 
-        example_run_glue_job()
+        asyncio.run(example_run_glue_job())
         ```
     """
 
@@ -143,6 +216,14 @@ class GlueJobBlock(JobBlock):
             "state of an Glue Job."
         ),
     )
+    job_watch_min_poll_interval: float = Field(
+        default=2.0,
+        description=(
+            "The amount of time to wait between the first AWS API calls after the "
+            "state of the Glue Job changes. The wait grows towards "
+            "`job_watch_poll_interval` while the state stays the same."
+        ),
+    )
 
     aws_credentials: AwsCredentials = Field(
         title="AWS Credentials",
@@ -158,6 +239,7 @@ class GlueJobBlock(JobBlock):
             job_name=self.job_name,
             job_id=job_run_id,
             job_watch_poll_interval=self.job_watch_poll_interval,
+            job_watch_min_poll_interval=self.job_watch_min_poll_interval,
         )
 
     def _start_job(self, client: _GlueJobClient) -> str:
@@ -182,7 +264,6 @@ class GlueJobBlock(JobBlock):
 
     def _get_client(self) -> _GlueJobClient:
         """
-        Retrieve a Glue Job Client
+        Retrieve a Glue Job Client. Will use a cached client if one exists.
         """
-        boto_session = self.aws_credentials.get_boto3_session()
-        return boto_session.client("glue")
+        return self.aws_credentials.get_client("glue")
@@ -115,11 +115,9 @@ class LambdaFunction(Block):
 
     def _get_lambda_client(self):
         """
-        Retrieve a boto3 session and Lambda client
+        Retrieve a Lambda client, reusing a cached client for these credentials
         """
-        boto_session = self.aws_credentials.get_boto3_session()
-        lambda_client = boto_session.client("lambda")
-        return lambda_client
+        return self.aws_credentials.get_client("lambda")
 
     @sync_compatible
     async def invoke(
@@ -38,21 +38,36 @@ help you debug task failures. To enable CloudWatch logging, you must provide an
 execution role ARN with permissions to create and write to log streams. See the
 `configure_cloudwatch_logs` field documentation for details.
 
+The worker shares its AWS clients between all of the flow runs it submits. Botocore
+keeps at most 10 connections per client by default; if the worker submits many flow
+runs concurrently, raise this limit by setting `max_pool_connections` in the Botocore
+config of the AWS credentials' client parameters.
+
 The worker can be configured to use an existing task definition by setting the task
 definition arn variable or by providing a "taskDefinition" in the task run request. When
 a task definition is provided, the worker will never create a new task definition which
 may result in variables that are templated into the task definition payload being
 ignored.
 """
-import copy
 import json
 import logging
 import shlex
 import sys
 import time
-from copy import deepcopy
-from typing import Any, Dict, Generator, List, NamedTuple, Optional, Tuple, Union
+from threading import Lock
+from typing import (
+    Any,
+    Dict,
+    FrozenSet,
+    Generator,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Union,
+)
 from uuid import UUID
+from weakref import WeakValueDictionary
 
 import anyio
 import anyio.abc
@@ -99,6 +114,8 @@ ECS_POST_REGISTRATION_FIELDS = [
     "registeredBy",
     "deregisteredAt",
 ]
+# Set form of ECS_POST_REGISTRATION_FIELDS for membership checks
+_ECS_POST_REGISTRATION_FIELD_SET = frozenset(ECS_POST_REGISTRATION_FIELDS)
 
 
 DEFAULT_TASK_DEFINITION_TEMPLATE = """
@@ -129,13 +146,32 @@ taskDefinition: "{{ task_definition_arn }}"
 capacityProviderStrategy: "{{ capacity_provider_strategy }}"
 """
 
+# Safe YAML loader, using libyaml when it is available
+_YAML_SAFE_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 # Create task run retry settings
 MAX_CREATE_TASK_RUN_ATTEMPTS = 3
 CREATE_TASK_RUN_MIN_DELAY_SECONDS = 1
 CREATE_TASK_RUN_MIN_DELAY_JITTER_SECONDS = 0
 CREATE_TASK_RUN_MAX_DELAY_JITTER_SECONDS = 3
 
+# Task definition ARNs registered for each deployment, least recently set first
 _TASK_DEFINITION_CACHE: Dict[UUID, str] = {}
+TASK_DEFINITION_CACHE_MAX_SIZE = 1024
+
+# Locks held while looking up or registering a task definition in each family; a lock
+# is dropped once no flow run holds or waits on it
+_TASK_DEFINITION_FAMILY_LOCKS: "WeakValueDictionary[str, Lock]" = WeakValueDictionary()
+_TASK_DEFINITION_FAMILY_LOCKS_LOCK = Lock()
+
+# Network configurations inferred from a VPC for each set of credentials, with the
+# monotonic time at which they were inferred
+_NETWORK_CONFIGURATION_CACHE: Dict[Tuple[Any, Optional[str]], Tuple[float, dict]] = {}
+NETWORK_CONFIGURATION_CACHE_TTL_SECONDS = 300
+NETWORK_CONFIGURATION_CACHE_MAX_SIZE = 128
+
+# Lock held while setting items in the caches above from concurrent flow runs
+_CACHE_LOCK = Lock()
 _TAG_REGEX = r"[^a-zA-Z0-9-_.=+-@: ]+"
 
 
@@ -152,31 +188,110 @@ def _default_task_definition_template() -> dict:
     """
     The default task definition template for ECS jobs.
     """
-    return yaml.safe_load(DEFAULT_TASK_DEFINITION_TEMPLATE)
+    return yaml.load(DEFAULT_TASK_DEFINITION_TEMPLATE, Loader=_YAML_SAFE_LOADER)
 
 
 def _default_task_run_request_template() -> dict:
     """
     The default task run request template for ECS jobs.
     """
-    return yaml.safe_load(DEFAULT_TASK_RUN_REQUEST_TEMPLATE)
+    return yaml.load(DEFAULT_TASK_RUN_REQUEST_TEMPLATE, Loader=_YAML_SAFE_LOADER)
+
+
+def _set_bounded_cache_item(cache: dict, key: Any, value: Any, max_size: int):
+    """
+    Set an item in a cache dict, evicting the oldest items to stay within `max_size`.
+
+    The item is moved to the end of the cache so the least recently set item is always
+    evicted first.
+    """
+    with _CACHE_LOCK:
+        cache.pop(key, None)
+        while len(cache) >= max_size:
+            cache.pop(next(iter(cache)), None)
+        cache[key] = value
 
 
-def _drop_empty_keys_from_task_definition(taskdef: dict):
+def _get_family_lock(family: str) -> Lock:
     """
-    Recursively drop keys with 'empty' values from a task definition dict.
+    Get the lock for a task definition family, creating one if the family has none.
+    """
+    with _TASK_DEFINITION_FAMILY_LOCKS_LOCK:
+        lock = _TASK_DEFINITION_FAMILY_LOCKS.get(family)
+        if lock is None:
+            lock = Lock()
+            _TASK_DEFINITION_FAMILY_LOCKS[family] = lock
+        return lock
+
+
+def _json_deepcopy(obj: Any) -> Any:
+    """
+    Copy a JSON-like object of nested dicts and lists.
 
-    Mutates the task definition in place. Only supports recursion into dicts and lists.
+    Unlike `copy.deepcopy`, no memo is kept and any other value is assumed to be
+    immutable and returned as-is, which is sufficient for task definition payloads.
     """
-    for key, value in tuple(taskdef.items()):
-        if not value:
-            taskdef.pop(key)
-        if isinstance(value, dict):
-            _drop_empty_keys_from_task_definition(value)
-        if isinstance(value, list):
-            for v in value:
-                if isinstance(v, dict):
-                    _drop_empty_keys_from_task_definition(v)
+    if isinstance(obj, dict):
+        return {key: _json_deepcopy(value) for key, value in obj.items()}
+    if isinstance(obj, list):
+        return [_json_deepcopy(value) for value in obj]
+    return obj
+
+
+def _task_definition_with_aws_defaults(taskdef: dict) -> dict:
+    """
+    Return a task definition with the defaults that AWS would set after registration.
+
+    Only the top-level dict and the first container definition are copied; the task
+    definition passed in is not modified.
+    """
+    taskdef = dict(taskdef)
+    taskdef.setdefault("networkMode", "bridge")
+
+    container_definitions = taskdef.get("containerDefinitions", [])
+    essential = any(container.get("essential") for container in container_definitions)
+    if not essential:
+        taskdef["containerDefinitions"] = [
+            {"essential": True, **container_definitions[0]},
+            *container_definitions[1:],
+        ]
+
+    return taskdef
+
+
+def _task_definition_dicts_equal(
+    dict_1: dict, dict_2: dict, ignored_keys: FrozenSet[str] = frozenset()
+) -> bool:
+    """
+    Compare two task definition dicts as if keys with 'empty' values were dropped.
+
+    Both dicts are walked in lockstep without being copied or modified. Only supports
+    recursion into dicts and lists. `ignored_keys` are only ignored at the top level of
+    the dicts.
+    """
+    keys_1 = {key for key, value in dict_1.items() if value and key not in ignored_keys}
+    keys_2 = {key for key, value in dict_2.items() if value and key not in ignored_keys}
+    if keys_1 != keys_2:
+        return False
+
+    for key in keys_1:
+        value_1, value_2 = dict_1[key], dict_2[key]
+        if isinstance(value_1, dict) and isinstance(value_2, dict):
+            if not _task_definition_dicts_equal(value_1, value_2):
+                return False
+        elif isinstance(value_1, list) and isinstance(value_2, list):
+            if len(value_1) != len(value_2):
+                return False
+            for v1, v2 in zip(value_1, value_2):
+                if isinstance(v1, dict) and isinstance(v2, dict):
+                    if not _task_definition_dicts_equal(v1, v2):
+                        return False
+                elif v1 != v2:
+                    return False
+        elif value_1 != value_2:
+            return False
+
+    return True
 
 
 def _get_container(containers: List[dict], name: str) -> Optional[dict]:
@@ -196,20 +311,19 @@ def _container_name_from_task_definition(task_definition: dict) -> Optional[str]
 
     If not found, `None` is returned.
     """
-    if task_definition:
-        container_definitions = task_definition.get("containerDefinitions", [])
-    else:
-        container_definitions = []
+    if not task_definition:
+        return None
+
+    container_definitions = task_definition.get("containerDefinitions", [])
+    if not container_definitions:
+        return None
 
     if _get_container(container_definitions, ECS_DEFAULT_CONTAINER_NAME):
         # Use the default container name if present
         return ECS_DEFAULT_CONTAINER_NAME
-    elif container_definitions:
-        # Otherwise, if there's at least one container definition try to get the
-        # name from that
-        return container_definitions[0].get("name")
 
-    return None
+    # Otherwise, try to get the name from the first container definition
+    return container_definitions[0].get("name")
 
 
 def parse_identifier(identifier: str) -> ECSIdentifier:
@@ -242,7 +356,7 @@ def mask_sensitive_env_values(
 
 def mask_api_key(task_run_request):
     return mask_sensitive_env_values(
-        deepcopy(task_run_request), ["PREFECT_API_KEY"], keep_length=6
+        _json_deepcopy(task_run_request), ["PREFECT_API_KEY"], keep_length=6
     )
 
 
@@ -723,12 +837,18 @@ class ECSWorker(BaseWorker):
 
         self._validate_task_definition(task_definition, configuration)
 
-        _TASK_DEFINITION_CACHE[flow_run.deployment_id] = task_definition_arn
+        _set_bounded_cache_item(
+            _TASK_DEFINITION_CACHE,
+            flow_run.deployment_id,
+            task_definition_arn,
+            max_size=TASK_DEFINITION_CACHE_MAX_SIZE,
+        )
 
         logger.info(f"Using ECS task definition {task_definition_arn!r}...")
-        logger.debug(
-            f"Task definition {json.dumps(task_definition, indent=2, default=str)}"
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                f"Task definition {json.dumps(task_definition, indent=2, default=str)}"
+            )
 
         task_run_request = self._prepare_task_run_request(
             configuration,
@@ -737,10 +857,11 @@ class ECSWorker(BaseWorker):
         )
 
         logger.info("Creating ECS task run...")
-        logger.debug(
-            "Task run request"
-            f"{json.dumps(mask_api_key(task_run_request), indent=2, default=str)}"
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Task run request"
+                f"{json.dumps(mask_api_key(task_run_request), indent=2, default=str)}"
+            )
 
         try:
             task = self._create_task_run(ecs_client, task_run_request)
@@ -776,48 +897,65 @@ class ECSWorker(BaseWorker):
         definition is newly registered.
         """
 
-        cached_task_definition_arn = _TASK_DEFINITION_CACHE.get(flow_run.deployment_id)
-        new_task_definition_registered = False
+        family = task_definition.get("family", ECS_DEFAULT_FAMILY)
 
-        if cached_task_definition_arn:
-            try:
-                cached_task_definition = self._retrieve_task_definition(
-                    logger, ecs_client, cached_task_definition_arn
-                )
-                if not cached_task_definition[
-                    "status"
-                ] == "ACTIVE" or not self._task_definitions_equal(
-                    task_definition, cached_task_definition
-                ):
+        # Concurrent flow runs for the same family wait for each other so that a burst
+        # of runs registers a single task definition; AWS also rejects concurrent
+        # registrations of new revisions in a family
+        family_lock = _get_family_lock(family)
+        with family_lock:
+            cached_task_definition_arn = _TASK_DEFINITION_CACHE.get(
+                flow_run.deployment_id
+            )
+            new_task_definition_registered = False
+
+            if cached_task_definition_arn:
+                try:
+                    cached_task_definition = self._retrieve_task_definition(
+                        logger, ecs_client, cached_task_definition_arn
+                    )
+                    if not cached_task_definition[
+                        "status"
+                    ] == "ACTIVE" or not self._task_definitions_equal(
+                        task_definition, cached_task_definition
+                    ):
+                        cached_task_definition_arn = None
+                except Exception:
                     cached_task_definition_arn = None
-            except Exception:
-                cached_task_definition_arn = None
 
-        if (
-            not cached_task_definition_arn
-            and configuration.match_latest_revision_in_family
-        ):
-            family_name = task_definition.get("family", ECS_DEFAULT_FAMILY)
-            try:
-                task_definition_from_family = self._retrieve_task_definition(
-                    logger, ecs_client, family_name
-                )
-                if task_definition_from_family and self._task_definitions_equal(
-                    task_definition, task_definition_from_family
-                ):
-                    cached_task_definition_arn = task_definition_from_family[
-                        "taskDefinitionArn"
-                    ]
-            except Exception:
-                cached_task_definition_arn = None
+            if (
+                not cached_task_definition_arn
+                and configuration.match_latest_revision_in_family
+            ):
+                try:
+                    task_definition_from_family = self._retrieve_task_definition(
+                        logger, ecs_client, family
+                    )
+                    if task_definition_from_family and self._task_definitions_equal(
+                        task_definition, task_definition_from_family
+                    ):
+                        cached_task_definition_arn = task_definition_from_family[
+                            "taskDefinitionArn"
+                        ]
+                except Exception:
+                    cached_task_definition_arn = None
 
-        if not cached_task_definition_arn:
-            task_definition_arn = self._register_task_definition(
-                logger, ecs_client, task_definition
-            )
-            new_task_definition_registered = True
-        else:
-            task_definition_arn = cached_task_definition_arn
+            if not cached_task_definition_arn:
+                task_definition_arn = self._register_task_definition(
+                    logger, ecs_client, task_definition
+                )
+                new_task_definition_registered = True
+
+                # Cache the task definition before releasing the lock so that waiting
+                # flow runs for the deployment can use it
+                _set_bounded_cache_item(
+                    _TASK_DEFINITION_CACHE,
+                    flow_run.deployment_id,
+                    task_definition_arn,
+                    max_size=TASK_DEFINITION_CACHE_MAX_SIZE,
+                )
+            else:
+                task_definition_arn = cached_task_definition_arn
 
         return task_definition_arn, new_task_definition_registered
 
@@ -972,10 +1110,11 @@ class ECSWorker(BaseWorker):
         Returns the ARN.
         """
         logger.info("Registering ECS task definition...")
-        logger.debug(
-            "Task definition request"
-            f"{json.dumps(task_definition, indent=2, default=str)}"
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Task definition request"
+                f"{json.dumps(task_definition, indent=2, default=str)}"
+            )
         response = ecs_client.register_task_definition(**task_definition)
         return response["taskDefinition"]["taskDefinitionArn"]
 
@@ -987,6 +1126,9 @@ class ECSWorker(BaseWorker):
     ):
         """
         Retrieve an existing task definition from AWS.
+
+        Descriptions are never cached: the status and latest revision checked by
+        callers can change outside of this worker at any time.
         """
         if task_definition.startswith("arn:aws:ecs:"):
             logger.info(f"Retrieving ECS task definition {task_definition!r}...")
@@ -1245,11 +1387,6 @@ class ECSWorker(BaseWorker):
             family = (
                 f"{ECS_DEFAULT_FAMILY}_{self._work_pool_name}_{flow_run.deployment_id}"
             )
-        slugify(
-            family,
-            max_length=255,
-            regex_pattern=r"[^a-zA-Z0-9-_]+",
-        )
         return family
 
     def _prepare_task_definition(
@@ -1261,7 +1398,7 @@ class ECSWorker(BaseWorker):
         """
         Prepare a task definition by inferring any defaults and merging overrides.
         """
-        task_definition = copy.deepcopy(configuration.task_definition)
+        task_definition = _json_deepcopy(configuration.task_definition)
 
         # Configure the Prefect runtime container
         task_definition.setdefault("containerDefinitions", [])
@@ -1301,9 +1438,12 @@ class ECSWorker(BaseWorker):
 
         # Remove any keys that have been explicitly "unset"
         unset_keys = {key for key, value in configuration.env.items() if value is None}
-        for item in tuple(container.get("environment", [])):
-            if item["name"] in unset_keys or item["value"] is None:
-                container["environment"].remove(item)
+        if container.get("environment"):
+            container["environment"] = [
+                item
+                for item in container["environment"]
+                if item["name"] not in unset_keys and item["value"] is not None
+            ]
 
         if configuration.configure_cloudwatch_logs:
             prefix = f"prefect-logs_{self._work_pool_name}_{flow_run.deployment_id}"
@@ -1370,7 +1510,18 @@ class ECSWorker(BaseWorker):
         """
         Load settings from a specific VPC or the default VPC and generate a task
         run request's network configuration.
+
+        VPCs and their subnets rarely change, so the generated network configuration
+        is cached for a short time for each set of credentials and VPC.
         """
+        cache_key = (configuration.aws_credentials, vpc_id)
+        cached = _NETWORK_CONFIGURATION_CACHE.get(cache_key)
+        if (
+            cached
+            and time.monotonic() - cached[0] < NETWORK_CONFIGURATION_CACHE_TTL_SECONDS
+        ):
+            return _json_deepcopy(cached[1])
+
         ec2_client = self._get_client(configuration, "ec2")
         vpc_message = "the default VPC" if not vpc_id else f"VPC with ID {vpc_id}"
 
@@ -1403,13 +1554,20 @@ class ECSWorker(BaseWorker):
                 "Network configuration cannot be inferred."
             )
 
-        return {
+        network_configuration = {
             "awsvpcConfiguration": {
                 "subnets": [s["SubnetId"] for s in subnets],
                 "assignPublicIp": "ENABLED",
                 "securityGroups": [],
             }
         }
+        _set_bounded_cache_item(
+            _NETWORK_CONFIGURATION_CACHE,
+            cache_key,
+            (time.monotonic(), network_configuration),
+            max_size=NETWORK_CONFIGURATION_CACHE_MAX_SIZE,
+        )
+        return _json_deepcopy(network_configuration)
 
     def _custom_network_configuration(
         self,
@@ -1464,7 +1622,11 @@ class ECSWorker(BaseWorker):
         """
         Prepare a task run request payload.
         """
-        task_run_request = deepcopy(configuration.task_run_request)
+        # Only top-level keys, the overrides, and the container overrides are modified
+        # below so a shallow copy of each is sufficient to leave the configuration as-is
+        task_run_request = dict(configuration.task_run_request)
+        if "overrides" in task_run_request:
+            task_run_request["overrides"] = dict(task_run_request["overrides"])
 
         task_run_request.setdefault("taskDefinition", task_definition_arn)
         assert task_run_request["taskDefinition"] == task_definition_arn
@@ -1487,7 +1649,9 @@ class ECSWorker(BaseWorker):
                 {"capacityProvider": "FARGATE_SPOT", "weight": 1}
             ]
         overrides = task_run_request.get("overrides", {})
-        container_overrides = overrides.get("containerOverrides", [])
+        container_overrides = [
+            dict(container) for container in overrides.get("containerOverrides", [])
+        ]
 
         # Ensure the network configuration is present if using awsvpc for network mode
         if (
@@ -1536,19 +1700,23 @@ class ECSWorker(BaseWorker):
         # Clean up templated variable formatting
 
         for container in container_overrides:
-            if isinstance(container.get("command"), str):
-                container["command"] = shlex.split(container["command"])
-            if isinstance(container.get("environment"), dict):
+            command = container.get("command")
+            if isinstance(command, str):
+                container["command"] = shlex.split(command)
+
+            # Convert environment mappings to lists and remove null values in a single
+            # pass — they're not allowed by AWS
+            environment = container.get("environment", [])
+            if isinstance(environment, dict):
                 container["environment"] = [
-                    {"name": k, "value": v} for k, v in container["environment"].items()
+                    {"name": k, "value": v}
+                    for k, v in environment.items()
+                    if v is not None
+                ]
+            else:
+                container["environment"] = [
+                    item for item in environment if item["value"] is not None
                 ]
-
-            # Remove null values — they're not allowed by AWS
-            container["environment"] = [
-                item
-                for item in container.get("environment", [])
-                if item["value"] is not None
-            ]
 
         if isinstance(task_run_request.get("tags"), dict):
             task_run_request["tags"] = [
@@ -1653,29 +1821,12 @@ class ECSWorker(BaseWorker):
         if taskdef_1 is None or taskdef_2 is None:
             return False
 
-        taskdef_1 = copy.deepcopy(taskdef_1)
-        taskdef_2 = copy.deepcopy(taskdef_2)
-
-        for taskdef in (taskdef_1, taskdef_2):
-            # Set defaults that AWS would set after registration
-            container_definitions = taskdef.get("containerDefinitions", [])
-            essential = any(
-                container.get("essential") for container in container_definitions
-            )
-            if not essential:
-                container_definitions[0].setdefault("essential", True)
-
-            taskdef.setdefault("networkMode", "bridge")
-
-        _drop_empty_keys_from_task_definition(taskdef_1)
-        _drop_empty_keys_from_task_definition(taskdef_2)
-
-        # Clear fields that change on registration for comparison
-        for field in ECS_POST_REGISTRATION_FIELDS:
-            taskdef_1.pop(field, None)
-            taskdef_2.pop(field, None)
-
-        return taskdef_1 == taskdef_2
+        # Ignore empty values and fields that change on registration for comparison
+        return _task_definition_dicts_equal(
+            _task_definition_with_aws_defaults(taskdef_1),
+            _task_definition_with_aws_defaults(taskdef_2),
+            ignored_keys=_ECS_POST_REGISTRATION_FIELD_SET,
+        )
 
     async def kill_infrastructure(
         self,
@@ -2,13 +2,20 @@ from setuptools import find_packages, setup
 
 import versioneer
 
-with open("requirements.txt") as install_requires_file:
-    install_requires = install_requires_file.read().strip().split("\n")
 
-with open("requirements-dev.txt") as dev_requires_file:
-    dev_requires = dev_requires_file.read().strip().split("\n")
+def read_requirements(path):
+    with open(path, encoding="utf-8") as requirements_file:
+        return [
+            line.strip()
+            for line in requirements_file
+            if line.strip() and not line.lstrip().startswith("#")
+        ]
+
+
+install_requires = read_requirements("requirements.txt")
+dev_requires = read_requirements("requirements-dev.txt")
 
-with open("README.md") as readme_file:
+with open("README.md", encoding="utf-8") as readme_file:
     readme = readme_file.read()
 
 setup(
@@ -11,16 +11,22 @@ from prefect_aws.credentials import (
 )
 
 
+@pytest.fixture
+def s3_mock():
+    with mock_s3():
+        yield
+
+
+@pytest.mark.usefixtures("s3_mock")
 def test_aws_credentials_get_boto3_session():
     """
     Asserts that instantiated AwsCredentials block creates an
     authenticated boto3 session.
     """
 
-    with mock_s3():
-        aws_credentials_block = AwsCredentials()
-        boto3_session = aws_credentials_block.get_boto3_session()
-        assert isinstance(boto3_session, Session)
+    aws_credentials_block = AwsCredentials()
+    boto3_session = aws_credentials_block.get_boto3_session()
+    assert isinstance(boto3_session, Session)
 
 
 def test_minio_credentials_get_boto3_session():
@@ -36,19 +42,20 @@ def test_minio_credentials_get_boto3_session():
     assert isinstance(boto3_session, Session)
 
 
-@pytest.mark.parametrize(
-    "credentials",
-    [
-        AwsCredentials(),
-        MinIOCredentials(
-            minio_root_user="root_user", minio_root_password="root_password"
-        ),
-    ],
-)
+@pytest.fixture
+def credentials(request):
+    if request.param == "aws":
+        return AwsCredentials()
+    return MinIOCredentials(
+        minio_root_user="root_user", minio_root_password="root_password"
+    )
+
+
+@pytest.mark.parametrize("credentials", ["aws", "minio"], indirect=True)
 @pytest.mark.parametrize("client_type", ["s3", ClientType.S3])
+@pytest.mark.usefixtures("s3_mock")
 def test_credentials_get_client(credentials, client_type):
-    with mock_s3():
-        assert isinstance(credentials.get_client(client_type), BaseClient)
+    assert isinstance(credentials.get_client(client_type), BaseClient)
 
 
 @pytest.mark.parametrize(
@@ -5,6 +5,7 @@ from copy import deepcopy
 from functools import partial
 from typing import Any, Awaitable, Callable, Dict, List, Optional
 from unittest.mock import MagicMock
+from unittest.mock import patch as mock_patch
 
 import anyio
 import pytest
@@ -20,6 +21,7 @@ from prefect.utilities.asyncutils import run_sync_in_worker_thread
 from prefect.utilities.dockerutils import get_prefect_image_name
 from pydantic import VERSION as PYDANTIC_VERSION
 
+from prefect_aws.credentials import AwsCredentials, ClientType
 from prefect_aws.workers.ecs_worker import ECSWorker
 
 if PYDANTIC_VERSION.startswith("2."):
@@ -50,7 +52,9 @@ def test_ecs_task_emits_deprecation_warning():
         ECSTask()
 
 
-setup_logging()
+@pytest.fixture(scope="session", autouse=True)
+def configure_logging():
+    setup_logging()
 
 
 BASE_TASK_DEFINITION_YAML = """
@@ -77,9 +81,14 @@ def inject_moto_patches(moto_mock, patches: Dict[str, List[Callable]]):
 
             for attr, attr_patches in patches.items():
                 original_method = getattr(backend, attr)
-                setattr(
-                    backend, attr, partial(injected_call, original_method, attr_patches)
-                )
+                if len(attr_patches) == 1:
+                    # Bind a lone patch directly instead of dispatching through a loop
+                    patched_method = partial(attr_patches[0], original_method)
+                else:
+                    patched_method = partial(
+                        injected_call, original_method, attr_patches
+                    )
+                setattr(backend, attr, patched_method)
 
 
 def patch_run_task(mock, run_task, *args, **kwargs):
@@ -166,6 +175,10 @@ def create_log_stream(session, run_task, *args, **kwargs):
     return tasks
 
 
+# moto's AMI catalog is static and slow to describe, so look it up once per region
+_DEFAULT_IMAGE_IDS = {}
+
+
 def add_ec2_instance_to_ecs_cluster(session, cluster_name):
     ecs_client = session.client("ecs")
     ec2_client = session.client("ec2")
@@ -173,8 +186,11 @@ def add_ec2_instance_to_ecs_cluster(session, cluster_name):
 
     ecs_client.create_cluster(clusterName=cluster_name)
 
-    images = ec2_client.describe_images()
-    image_id = images["Images"][0]["ImageId"]
+    region_name = ec2_client.meta.region_name
+    if region_name not in _DEFAULT_IMAGE_IDS:
+        images = ec2_client.describe_images()
+        _DEFAULT_IMAGE_IDS[region_name] = images["Images"][0]["ImageId"]
+    image_id = _DEFAULT_IMAGE_IDS[region_name]
 
     test_instance = ec2_resource.create_instances(
         ImageId=image_id, MinCount=1, MaxCount=1
@@ -289,6 +305,16 @@ def ecs_mocks(aws_credentials):
                 yield ecs
 
 
+def test_preview(aws_credentials):
+    task = ECSTask(aws_credentials=aws_credentials, command=["prefect", "version"])
+
+    preview = task.preview()
+
+    assert "# Task definition" in preview
+    assert "# Task run request" in preview
+    assert "<registered at runtime>" in preview
+
+
 @pytest.mark.usefixtures("ecs_mocks")
 @pytest.mark.parametrize("launch_type", ["EC2", "FARGATE", "FARGATE_SPOT"])
 async def test_launch_types(aws_credentials, launch_type: str):
@@ -298,7 +324,6 @@ async def test_launch_types(aws_credentials, launch_type: str):
         command=["prefect", "version"],
         launch_type=launch_type,
     )
-    print(task.preview())
 
     session = aws_credentials.get_boto3_session()
     ecs_client = session.client("ecs")
@@ -342,7 +367,6 @@ async def test_cpu_and_memory(aws_credentials, launch_type: str, cpu: int, memor
         cpu=cpu,
         memory=memory,
     )
-    print(task.preview())
 
     session = aws_credentials.get_boto3_session()
     ecs_client = session.client("ecs")
@@ -383,7 +407,6 @@ async def test_network_mode_default(aws_credentials, launch_type: str):
         command=["prefect", "version"],
         launch_type=launch_type,
     )
-    print(task.preview())
 
     session = aws_credentials.get_boto3_session()
     ecs_client = session.client("ecs")
@@ -408,7 +431,6 @@ async def test_container_command(aws_credentials, launch_type: str):
         command=["prefect", "version"],
         launch_type=launch_type,
     )
-    print(task.preview())
 
     session = aws_credentials.get_boto3_session()
     ecs_client = session.client("ecs")
@@ -428,7 +450,6 @@ async def test_environment_variables(aws_credentials):
         auto_deregister_task_definition=False,
         env={"FOO": "BAR"},
     )
-    print(task.preview())
 
     session = aws_credentials.get_boto3_session()
     ecs_client = session.client("ecs")
@@ -462,7 +483,6 @@ async def test_labels(aws_credentials):
         auto_deregister_task_definition=False,
         labels={"foo": "bar"},
     )
-    print(task.preview())
 
     session = aws_credentials.get_boto3_session()
     ecs_client = session.client("ecs")
@@ -486,7 +506,6 @@ async def test_container_command_from_task_definition(aws_credentials):
         },
         command=[],
     )
-    print(task.preview())
 
     session = aws_credentials.get_boto3_session()
     ecs_client = session.client("ecs")
@@ -512,7 +531,6 @@ async def test_extra_containers_in_task_definition(aws_credentials):
         command=["prefect", "version"],
         image="test",
     )
-    print(task.preview())
 
     session = aws_credentials.get_boto3_session()
     ecs_client = session.client("ecs")
@@ -564,7 +582,6 @@ async def test_prefect_container_in_task_definition(aws_credentials):
         command=["prefect", "version"],
         image="test",
     )
-    print(task.preview())
 
     session = aws_credentials.get_boto3_session()
     ecs_client = session.client("ecs")
@@ -612,7 +629,6 @@ async def test_default_image_in_task_definition(aws_credentials):
         },
         command=["prefect", "version"],
     )
-    print(task.preview())
 
     session = aws_credentials.get_boto3_session()
     ecs_client = session.client("ecs")
@@ -647,7 +663,6 @@ async def test_image_overrides_task_definition(aws_credentials):
         command=["prefect", "version"],
         image="override-image",
     )
-    print(task.preview())
 
     session = aws_credentials.get_boto3_session()
     ecs_client = session.client("ecs")
@@ -688,7 +703,6 @@ async def test_default_image(aws_credentials, task_definition):
         task_definition=task_definition,
         command=["prefect", "version"],
     )
-    print(task.preview())
     session = aws_credentials.get_boto3_session()
     ecs_client = session.client("ecs")
 
@@ -731,7 +745,6 @@ async def test_default_cpu_and_memory_in_task_definition(
         image="test",
         launch_type=launch_type,
     )
-    print(task.preview())
 
     session = aws_credentials.get_boto3_session()
     ecs_client = session.client("ecs")
@@ -778,7 +791,6 @@ async def test_environment_variables_in_task_definition(aws_credentials):
         },
         env={"FOO": "BAR", "OVERRIDE": "NEW"},
     )
-    print(task.preview())
 
     session = aws_credentials.get_boto3_session()
     ecs_client = session.client("ecs")
@@ -830,7 +842,6 @@ async def test_unset_environment_variables_in_task_definition(aws_credentials):
         },
         env={"FOO": None},
     )
-    print(task.preview())
 
     session = aws_credentials.get_boto3_session()
     ecs_client = session.client("ecs")
@@ -872,7 +883,6 @@ async def test_execution_role_arn_in_task_definition(
         task_definition={"executionRoleArn": "test"},
         execution_role_arn="override" if provided_as_field else None,
     )
-    print(task.preview())
 
     task_arn = await run_then_stop_task(task)
 
@@ -903,7 +913,6 @@ async def test_cluster(aws_credentials, default_cluster: bool):
         auto_deregister_task_definition=False,
         cluster=None if default_cluster else "second-cluster",
     )
-    print(task.preview())
 
     task_arn = await run_then_stop_task(task)
 
@@ -925,7 +934,6 @@ async def test_execution_role_arn(aws_credentials):
         auto_deregister_task_definition=False,
         execution_role_arn="test",
     )
-    print(task.preview())
 
     task_arn = await run_then_stop_task(task)
 
@@ -945,7 +953,6 @@ async def test_task_role_arn(aws_credentials):
         auto_deregister_task_definition=False,
         task_role_arn="test",
     )
-    print(task.preview())
 
     task_arn = await run_then_stop_task(task)
 
@@ -968,8 +975,6 @@ async def test_network_config_from_vpc_id(aws_credentials):
     mock_run_task = MagicMock(side_effect=original_run_task)
     task._run_task = mock_run_task
 
-    print(task.preview())
-
     await run_then_stop_task(task)
 
     network_configuration = mock_run_task.call_args[0][1].get("networkConfiguration")
@@ -1003,8 +1008,6 @@ async def test_network_config_from_default_vpc(aws_credentials):
     mock_run_task = MagicMock(side_effect=original_run_task)
     task._run_task = mock_run_task
 
-    print(task.preview())
-
     await run_then_stop_task(task)
 
     network_configuration = mock_run_task.call_args[0][1].get("networkConfiguration")
@@ -1039,8 +1042,6 @@ async def test_network_config_is_empty_without_awsvpc_network_mode(
     mock_run_task = MagicMock(side_effect=original_run_task)
     task._run_task = mock_run_task
 
-    print(task.preview())
-
     await run_then_stop_task(task)
 
     network_configuration = mock_run_task.call_args[0][1].get("networkConfiguration")
@@ -1074,7 +1075,6 @@ async def test_network_config_from_vpc_with_no_subnets(aws_credentials):
         auto_deregister_task_definition=False,
         vpc_id=vpc.id,
     )
-    print(task.preview())
 
     with pytest.raises(
         ValueError, match=f"Failed to find subnets for VPC with ID {vpc.id}"
@@ -1220,6 +1220,30 @@ async def test_stream_output(aws_credentials, caplog):
     # assert "test-message-{i}" in err
 
 
+@pytest.mark.usefixtures("ecs_mocks")
+async def test_clients_are_configured_by_credentials(aws_credentials):
+    task = ECSTask(
+        aws_credentials=aws_credentials,
+        command=["prefect", "version"],
+        configure_cloudwatch_logs=True,
+        stream_output=True,
+        execution_role_arn="test",
+        task_watch_poll_interval=0.1,
+    )
+
+    # All clients must apply the credentials' client parameters, as in the worker
+    with mock_patch.object(
+        AwsCredentials,
+        "get_client",
+        autospec=True,
+        side_effect=AwsCredentials.get_client,
+    ) as get_client:
+        await run_then_stop_task(task)
+
+    client_types = {call.args[1] for call in get_client.call_args_list}
+    assert client_types == {ClientType.ECS, "ec2", "logs"}
+
+
 @pytest.mark.usefixtures("ecs_mocks")
 async def test_cloudwatch_log_options(aws_credentials):
     session = aws_credentials.get_boto3_session()
@@ -1287,7 +1311,6 @@ async def test_deregister_task_definition(aws_credentials):
         aws_credentials=aws_credentials,
         auto_deregister_task_definition=True,
     )
-    print(task.preview())
 
     session = aws_credentials.get_boto3_session()
     ecs_client = session.client("ecs")
@@ -1302,7 +1325,6 @@ async def test_deregister_task_definition(aws_credentials):
 @pytest.mark.usefixtures("ecs_mocks")
 async def test_latest_task_definition_used_if_equal(aws_credentials):
     task = ECSTask(aws_credentials=aws_credentials)
-    print(task.preview())
 
     session = aws_credentials.get_boto3_session()
     ecs_client = session.client("ecs")
@@ -1441,7 +1463,6 @@ async def test_task_definition_arn(aws_credentials):
         launch_type="EC2",
         image=None,
     )
-    print(task.preview())
     task_arn = await run_then_stop_task(task)
 
     assert task.image is None, "Image option can be null when using task definition arn"
@@ -1478,7 +1499,6 @@ async def test_task_definition_arn_with_overrides_that_require_copy(
         launch_type="EC2",
         **overrides,
     )
-    print(task.preview())
     with caplog.at_level(logging.INFO, logger=task.logger.name):
         task_arn = await run_then_stop_task(task)
 
@@ -1517,7 +1537,6 @@ async def test_task_definition_arn_with_overrides_requiring_copy_shows_diff(
         launch_type="EC2",
         image="foobar",
     )
-    print(task.preview())
     with caplog.at_level(logging.DEBUG, logger=task.logger.name):
         await run_then_stop_task(task)
 
@@ -1586,7 +1605,6 @@ async def test_task_definition_arn_with_overrides_that_do_not_require_copy(
         image=None,
         **overrides,
     )
-    print(task.preview())
     task_arn = await run_then_stop_task(task)
 
     task = describe_task(ecs_client, task_arn)
@@ -1611,7 +1629,6 @@ async def test_deregister_task_definition_does_not_apply_to_linked_arn(aws_crede
         launch_type="EC2",
         image=None,
     )
-    print(task.preview())
     task_arn = await run_then_stop_task(task)
 
     task = describe_task(ecs_client, task_arn)
@@ -1646,8 +1663,6 @@ async def test_adding_security_groups_to_network_config(aws_credentials):
     mock_run_task = MagicMock(side_effect=original_run_task)
     task._run_task = mock_run_task
 
-    print(task.preview())
-
     await run_then_stop_task(task)
 
     network_configuration = mock_run_task.call_args[0][1].get("networkConfiguration")
@@ -1686,8 +1701,6 @@ async def test_disable_public_ip_in_network_config(aws_credentials):
     mock_run_task = MagicMock(side_effect=original_run_task)
     task._run_task = mock_run_task
 
-    print(task.preview())
-
     await run_then_stop_task(task)
 
     network_configuration = mock_run_task.call_args[0][1].get("networkConfiguration")
@@ -1730,8 +1743,6 @@ async def test_custom_subnets_in_the_network_configuration(aws_credentials):
     mock_run_task = MagicMock(side_effect=original_run_task)
     task._run_task = mock_run_task
 
-    print(task.preview())
-
     await run_then_stop_task(task)
 
     network_configuration = mock_run_task.call_args[0][1].get("networkConfiguration")
@@ -1822,7 +1833,6 @@ async def test_family_from_flow_run_metadata(
         auto_deregister_task_definition=False,
         **fields,
     ).prepare_for_flow_run(**prepare_inputs)
-    print(task.preview())
 
     session = aws_credentials.get_boto3_session()
     ecs_client = session.client("ecs")
@@ -1855,7 +1865,6 @@ async def test_user_provided_family(aws_credentials, given_family, expected_fami
         auto_deregister_task_definition=False,
         family=given_family,
     )
-    print(task.preview())
 
     session = aws_credentials.get_boto3_session()
     ecs_client = session.client("ecs")
@@ -1891,8 +1900,6 @@ async def test_family_from_task_definition_arn(aws_credentials, prepare_for_flow
             deployment=Deployment.construct(name="bar"),
         )
 
-    print(task.preview())
-
     task_arn = await run_then_stop_task(task)
 
     task = describe_task(ecs_client, task_arn)
@@ -1921,7 +1928,6 @@ async def test_kill(aws_credentials, cluster: str):
         auto_deregister_task_definition=False,
         cluster=cluster,
     )
-    print(task.preview())
 
     with anyio.fail_after(5):
         async with anyio.create_task_group() as tg:
@@ -1941,7 +1947,6 @@ async def test_kill_with_invalid_identifier(aws_credentials):
         auto_deregister_task_definition=False,
         command=["sleep", "1000"],
     )
-    print(task.preview())
 
     with pytest.raises(ValueError):
         await task.kill("test")
@@ -1955,7 +1960,6 @@ async def test_kill_with_mismatched_cluster(aws_credentials):
         command=["sleep", "1000"],
         cluster="foo",
     )
-    print(task.preview())
 
     with pytest.raises(
         InfrastructureNotAvailable,
@@ -1975,7 +1979,6 @@ async def test_kill_with_cluster_that_does_not_exist(aws_credentials):
         command=["sleep", "1000"],
         cluster="foo",
     )
-    print(task.preview())
 
     with pytest.raises(
         InfrastructureNotFound,
@@ -1992,7 +1995,6 @@ async def test_kill_with_task_that_does_not_exist(aws_credentials):
         command=["sleep", "1000"],
         cluster="default",
     )
-    print(task.preview())
 
     # Run the task so that a task definition is registered in the cluster
     await run_then_stop_task(task)
@@ -2015,7 +2017,6 @@ async def test_kill_with_cluster_that_has_no_tasks(aws_credentials):
         command=["sleep", "1000"],
         cluster="default",
     )
-    print(task.preview())
 
     with pytest.raises(
         InfrastructureNotFound,
@@ -2032,7 +2033,6 @@ async def test_kill_with_task_that_is_already_stopped(aws_credentials):
         command=["sleep", "1000"],
         cluster="default",
     )
-    print(task.preview())
 
     # Run and stop the task
     task_arn = await run_then_stop_task(task)
@@ -2050,7 +2050,6 @@ async def test_kill_with_grace_period(aws_credentials, caplog):
         aws_credentials=aws_credentials,
         auto_deregister_task_definition=False,
     )
-    print(task.preview())
 
     with anyio.fail_after(5):
         async with anyio.create_task_group() as tg:
@@ -1,6 +1,7 @@
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from botocore.exceptions import ClientError, EndpointConnectionError
 from moto import mock_glue
 
 from prefect_aws.glue_job import GlueJobBlock, GlueJobRun
@@ -13,6 +14,34 @@ def glue_job_client(aws_credentials):
         yield boto_session.client("glue", region_name="us-east-1")
 
 
+@pytest.fixture
+def mock_glue_job_client():
+    """
+    Build a client stub whose `get_job_run` returns a job run in each of the given
+    states in turn. Exceptions in place of a state are raised by that call instead.
+    """
+
+    def scripted_client(*states):
+        client = MagicMock()
+        client.get_job_run.side_effect = [
+            (
+                state
+                if isinstance(state, Exception)
+                else {
+                    "JobRun": {
+                        "JobName": "test_job_name",
+                        "JobRunState": state,
+                        "ErrorMessage": "err",
+                    }
+                }
+            )
+            for state in states
+        ]
+        return client
+
+    return scripted_client
+
+
 async def test_fetch_result(aws_credentials, glue_job_client):
     glue_job_client.create_job(
         Name="test_job_name", Role="test-role", Command={}, DefaultArguments={}
@@ -28,85 +57,121 @@ async def test_fetch_result(aws_credentials, glue_job_client):
     assert result == "SUCCEEDED"
 
 
-def test_wait_for_completion(aws_credentials, glue_job_client):
-    with mock_glue():
-        glue_job_client.create_job(
-            Name="test_job_name", Role="test-role", Command={}, DefaultArguments={}
-        )
-        job_run_id = glue_job_client.start_job_run(
-            JobName="test_job_name",
-            Arguments={},
-        )["JobRunId"]
-
-        glue_job_run = GlueJobRun(
-            job_name="test_job_name",
-            job_id=job_run_id,
-            job_watch_poll_interval=0.1,
-            client=glue_job_client,
-        )
+def test_wait_for_completion(mock_glue_job_client):
+    client = mock_glue_job_client("RUNNING", "SUCCEEDED")
+    glue_job_run = GlueJobRun(
+        job_name="test_job_name",
+        job_id="test_job_run_id",
+        job_watch_poll_interval=0.1,
+        client=client,
+    )
 
-        glue_job_client.get_job_run = MagicMock(
-            side_effect=[
-                {
-                    "JobRun": {
-                        "JobName": "test_job_name",
-                        "JobRunState": "RUNNING",
-                    }
-                },
-                {
-                    "JobRun": {
-                        "JobName": "test_job_name",
-                        "JobRunState": "SUCCEEDED",
-                    }
-                },
-            ]
-        )
-        glue_job_run.wait_for_completion()
+    # Synchronous callers block until the job run completes
+    glue_job_run.wait_for_completion()
 
+    assert client.get_job_run.call_count == 2
 
-def test_wait_for_completion_fail(aws_credentials, glue_job_client):
-    with mock_glue():
-        glue_job_client.create_job(
-            Name="test_job_name", Role="test-role", Command={}, DefaultArguments={}
-        )
-        job_run_id = glue_job_client.start_job_run(
-            JobName="test_job_name",
-            Arguments={},
-        )["JobRunId"]
-        glue_job_client.get_job_run = MagicMock(
-            side_effect=[
-                {
-                    "JobRun": {
-                        "JobName": "test_job_name",
-                        "JobRunState": "FAILED",
-                        "ErrorMessage": "err",
-                    }
-                },
-            ]
-        )
 
-        glue_job_run = GlueJobRun(
-            job_name="test_job_name", job_id=job_run_id, client=glue_job_client
-        )
-        with pytest.raises(RuntimeError):
-            glue_job_run.wait_for_completion()
+async def test_wait_for_completion_backs_off_until_state_changes(mock_glue_job_client):
+    client = mock_glue_job_client(
+        "STARTING", "RUNNING", "RUNNING", "RUNNING", "RUNNING", "SUCCEEDED"
+    )
+    glue_job_run = GlueJobRun(
+        job_name="test_job_name",
+        job_id="test_job_run_id",
+        job_watch_poll_interval=4.0,
+        job_watch_min_poll_interval=2.0,
+        client=client,
+    )
+
+    with patch("prefect_aws.glue_job.anyio.sleep", new_callable=AsyncMock) as sleep:
+        await glue_job_run.wait_for_completion()
+
+    assert [call.args[0] for call in sleep.await_args_list] == [
+        2.0,
+        2.0,
+        3.0,
+        4.0,
+        4.0,
+    ]
+
+
+@pytest.mark.parametrize(
+    "error",
+    [
+        ClientError({"Error": {"Code": "ThrottlingException"}}, "GetJobRun"),
+        EndpointConnectionError(endpoint_url="https://glue.us-east-1.amazonaws.com"),
+    ],
+)
+async def test_wait_for_completion_retries_transient_errors(
+    mock_glue_job_client, error
+):
+    client = mock_glue_job_client(error, "SUCCEEDED")
+    glue_job_run = GlueJobRun(
+        job_name="test_job_name", job_id="test_job_run_id", client=client
+    )
+
+    with patch("prefect_aws.glue_job.anyio.sleep", new_callable=AsyncMock):
+        await glue_job_run.wait_for_completion()
+
+    assert client.get_job_run.call_count == 2
+
+
+async def test_wait_for_completion_raises_other_client_errors(mock_glue_job_client):
+    client = mock_glue_job_client(
+        ClientError({"Error": {"Code": "EntityNotFoundException"}}, "GetJobRun"),
+        "SUCCEEDED",
+    )
+    glue_job_run = GlueJobRun(
+        job_name="test_job_name", job_id="test_job_run_id", client=client
+    )
+
+    with patch("prefect_aws.glue_job.anyio.sleep", new_callable=AsyncMock):
+        with pytest.raises(ClientError):
+            await glue_job_run.wait_for_completion()
+
+    assert client.get_job_run.call_count == 1
+
+
+async def test_wait_for_completion_raises_after_max_retries(mock_glue_job_client):
+    throttled = ClientError({"Error": {"Code": "ThrottlingException"}}, "GetJobRun")
+    client = mock_glue_job_client(*[throttled] * 6, "SUCCEEDED")
+    glue_job_run = GlueJobRun(
+        job_name="test_job_name", job_id="test_job_run_id", client=client
+    )
+
+    with patch("prefect_aws.glue_job.anyio.sleep", new_callable=AsyncMock):
+        with pytest.raises(ClientError):
+            await glue_job_run.wait_for_completion()
+
+    # The first poll and five retries
+    assert client.get_job_run.call_count == 6
+
+
+def test_wait_for_completion_fail(mock_glue_job_client):
+    glue_job_run = GlueJobRun(
+        job_name="test_job_name",
+        job_id="test_job_run_id",
+        client=mock_glue_job_client("FAILED"),
+    )
+    with pytest.raises(RuntimeError):
+        glue_job_run.wait_for_completion()
 
 
 def test__get_job_run(aws_credentials, glue_job_client):
-    with mock_glue():
-        glue_job_client.create_job(
-            Name="test_job_name", Role="test-role", Command={}, DefaultArguments={}
-        )
-        job_run_id = glue_job_client.start_job_run(
-            JobName="test_job_name",
-            Arguments={},
-        )["JobRunId"]
+    glue_job_client.create_job(
+        Name="test_job_name", Role="test-role", Command={}, DefaultArguments={}
+    )
+    job_run_id = glue_job_client.start_job_run(
+        JobName="test_job_name",
+        Arguments={},
+    )["JobRunId"]
 
-        glue_job_run = GlueJobRun(
-            job_name="test_job_name", job_id=job_run_id, client=glue_job_client
-        )
-        response = glue_job_run._get_job_run()
-        assert response["JobRun"]["JobRunState"] == "SUCCEEDED"
+    glue_job_run = GlueJobRun(
+        job_name="test_job_name", job_id=job_run_id, client=glue_job_client
+    )
+    response = glue_job_run._get_job_run()
+    assert response["JobRun"]["JobRunState"] == "SUCCEEDED"
 
 
 async def test_trigger(aws_credentials, glue_job_client):
@@ -124,25 +189,39 @@ async def test_trigger(aws_credentials, glue_job_client):
     assert isinstance(glue_job_run, GlueJobRun)
 
 
+async def test_trigger_passes_poll_intervals(aws_credentials):
+    glue_job = GlueJobBlock(
+        job_name="test_job_name",
+        job_watch_poll_interval=30.0,
+        job_watch_min_poll_interval=30.0,
+        aws_credentials=aws_credentials,
+    )
+    glue_job._get_client = MagicMock()
+    glue_job._start_job = MagicMock(return_value="test_job_id")
+
+    glue_job_run = await glue_job.trigger()
+
+    assert glue_job_run.job_watch_poll_interval == 30.0
+    assert glue_job_run.job_watch_min_poll_interval == 30.0
+
+
 def test_start_job(aws_credentials, glue_job_client):
-    with mock_glue():
-        glue_job_client.create_job(
-            Name="test_job_name", Role="test-role", Command={}, DefaultArguments={}
-        )
-        glue_job = GlueJobBlock(job_name="test_job_name", arguments={"arg1": "value1"})
+    glue_job_client.create_job(
+        Name="test_job_name", Role="test-role", Command={}, DefaultArguments={}
+    )
+    glue_job = GlueJobBlock(job_name="test_job_name", arguments={"arg1": "value1"})
 
-        glue_job_client.start_job_run = MagicMock(
-            side_effect=[{"JobRunId": "test_job_run_id"}]
-        )
-        job_run_id = glue_job._start_job(glue_job_client)
-        assert job_run_id == "test_job_run_id"
+    glue_job_client.start_job_run = MagicMock(
+        side_effect=[{"JobRunId": "test_job_run_id"}]
+    )
+    job_run_id = glue_job._start_job(glue_job_client)
+    assert job_run_id == "test_job_run_id"
 
 
 def test_start_job_fail_because_not_exist_job(aws_credentials, glue_job_client):
-    with mock_glue():
-        glue_job = GlueJobBlock(job_name="test_job_name", arguments={"arg1": "value1"})
-        with pytest.raises(RuntimeError):
-            glue_job._start_job(glue_job_client)
+    glue_job = GlueJobBlock(job_name="test_job_name", arguments={"arg1": "value1"})
+    with pytest.raises(RuntimeError):
+        glue_job._start_job(glue_job_client)
 
 
 def test_get_client(aws_credentials):
@@ -187,6 +187,13 @@ class TestLambdaFunction:
         assert function.function_name == "test-function"
         assert function.qualifier is None
 
+    def test_lambda_client_is_reused(self, aws_credentials):
+        function = LambdaFunction(
+            function_name="test-function",
+            aws_credentials=aws_credentials,
+        )
+        assert function._get_lambda_client() is function._get_lambda_client()
+
     @pytest.mark.parametrize(
         "payload,expected,handler",
         [
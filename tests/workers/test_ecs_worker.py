@@ -1,5 +1,7 @@
 import json
 import logging
+import threading
+from copy import deepcopy
 from functools import partial
 from typing import Any, Awaitable, Callable, Dict, List, Optional
 from unittest.mock import ANY, MagicMock
@@ -23,7 +25,9 @@ else:
 
 from prefect_aws.credentials import _get_client_cached
 from prefect_aws.workers.ecs_worker import (
+    _NETWORK_CONFIGURATION_CACHE,
     _TASK_DEFINITION_CACHE,
+    _TASK_DEFINITION_FAMILY_LOCKS,
     ECS_DEFAULT_CONTAINER_NAME,
     ECS_DEFAULT_CPU,
     ECS_DEFAULT_FAMILY,
@@ -35,6 +39,9 @@ from prefect_aws.workers.ecs_worker import (
     InfrastructureNotAvailable,
     InfrastructureNotFound,
     _get_container,
+    _get_family_lock,
+    _json_deepcopy,
+    _set_bounded_cache_item,
     get_prefect_image_name,
     mask_sensitive_env_values,
     parse_identifier,
@@ -65,6 +72,7 @@ def container_status_code():
 @pytest.fixture(autouse=True)
 def reset_task_definition_cache():
     _TASK_DEFINITION_CACHE.clear()
+    _NETWORK_CONFIGURATION_CACHE.clear()
     yield
 
 
@@ -88,9 +96,14 @@ def inject_moto_patches(moto_mock, patches: Dict[str, List[Callable]]):
 
             for attr, attr_patches in patches.items():
                 original_method = getattr(backend, attr)
-                setattr(
-                    backend, attr, partial(injected_call, original_method, attr_patches)
-                )
+                if len(attr_patches) == 1:
+                    # Bind a lone patch directly instead of dispatching through a loop
+                    patched_method = partial(attr_patches[0], original_method)
+                else:
+                    patched_method = partial(
+                        injected_call, original_method, attr_patches
+                    )
+                setattr(backend, attr, patched_method)
 
 
 def patch_run_task(mock, run_task, *args, **kwargs):
@@ -213,6 +226,10 @@ def create_log_stream(session, run_task, *args, **kwargs):
     return tasks
 
 
+# moto's AMI catalog is static and slow to describe, so look it up once per region
+_DEFAULT_IMAGE_IDS = {}
+
+
 def add_ec2_instance_to_ecs_cluster(session, cluster_name):
     ecs_client = session.client("ecs")
     ec2_client = session.client("ec2")
@@ -220,8 +237,11 @@ def add_ec2_instance_to_ecs_cluster(session, cluster_name):
 
     ecs_client.create_cluster(clusterName=cluster_name)
 
-    images = ec2_client.describe_images()
-    image_id = images["Images"][0]["ImageId"]
+    region_name = ec2_client.meta.region_name
+    if region_name not in _DEFAULT_IMAGE_IDS:
+        images = ec2_client.describe_images()
+        _DEFAULT_IMAGE_IDS[region_name] = images["Images"][0]["ImageId"]
+    image_id = _DEFAULT_IMAGE_IDS[region_name]
 
     test_instance = ec2_resource.create_instances(
         ImageId=image_id, MinCount=1, MaxCount=1
@@ -1582,6 +1602,58 @@ async def test_worker_caches_registered_task_definitions(
     assert flow_run.deployment_id in _TASK_DEFINITION_CACHE
 
 
+@pytest.mark.usefixtures("ecs_mocks")
+async def test_worker_registers_task_definition_once_for_concurrent_runs(
+    aws_credentials: AwsCredentials, flow_run: FlowRun, monkeypatch
+):
+    configuration = await construct_configuration(
+        aws_credentials=aws_credentials, command="echo test"
+    )
+
+    # Hold the first registration until both runs have reached the family lock so
+    # that the runs are guaranteed to overlap
+    both_runs_waiting = threading.Event()
+    family_lock_calls = []
+
+    def get_family_lock(family):
+        family_lock_calls.append(family)
+        if len(family_lock_calls) == 2:
+            both_runs_waiting.set()
+        return _get_family_lock(family)
+
+    monkeypatch.setattr(
+        "prefect_aws.workers.ecs_worker._get_family_lock", get_family_lock
+    )
+
+    async with ECSWorker(work_pool_name="test") as worker:
+        register_task_definition = worker._register_task_definition
+
+        def register_task_definition_when_both_runs_waiting(*args, **kwargs):
+            assert both_runs_waiting.wait(timeout=10)
+            return register_task_definition(*args, **kwargs)
+
+        worker._register_task_definition = MagicMock(
+            side_effect=register_task_definition_when_both_runs_waiting
+        )
+
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(run_then_stop_task, worker, configuration, flow_run)
+            tg.start_soon(run_then_stop_task, worker, configuration, flow_run)
+
+    worker._register_task_definition.assert_called_once()
+
+
+def test_get_family_lock_reuses_lock_while_referenced():
+    lock = _get_family_lock("prefect")
+
+    assert _get_family_lock("prefect") is lock
+    assert _get_family_lock("other") is not lock
+
+    # Idle locks are dropped rather than kept for the lifetime of the worker
+    del lock
+    assert "prefect" not in _TASK_DEFINITION_FAMILY_LOCKS
+
+
 @pytest.mark.usefixtures("ecs_mocks")
 async def test_worker_cache_miss_for_registered_task_definitions_clears_from_cache(
     aws_credentials: AwsCredentials, flow_run: FlowRun
@@ -2175,6 +2247,26 @@ async def test_user_defined_tags_in_task_run_request_template(
     ]
 
 
+@pytest.mark.usefixtures("ecs_mocks")
+async def test_task_run_request_in_configuration_is_not_modified(
+    aws_credentials: AwsCredentials, flow_run: FlowRun
+):
+    configuration = await construct_configuration(
+        aws_credentials=aws_credentials,
+        command="echo test",
+        env={"FOO": "BAR"},
+        labels={"FOO": "BAR"},
+        launch_type="FARGATE_SPOT",
+    )
+    original_task_run_request = deepcopy(configuration.task_run_request)
+
+    async with ECSWorker(work_pool_name="test") as worker:
+        result = await run_then_stop_task(worker, configuration, flow_run)
+
+    assert result.status_code == 0
+    assert configuration.task_run_request == original_task_run_request
+
+
 @pytest.mark.usefixtures("ecs_mocks")
 @pytest.mark.parametrize(
     "cluster", [None, "default", "second-cluster", "second-cluster-arn"]
@@ -2425,3 +2517,131 @@ async def test_get_or_generate_family(
     task = describe_task(ecs_client, task_arn)
     task_definition = describe_task_definition(ecs_client, task)
     assert task_definition["family"] == family
+
+
+def test_json_deepcopy():
+    task_definition = {
+        "containerDefinitions": [
+            {"name": "prefect", "environment": [{"name": "FOO", "value": "BAR"}]}
+        ],
+        "cpu": "1024",
+        "revision": 1,
+    }
+
+    copied = _json_deepcopy(task_definition)
+
+    assert copied == task_definition
+    copied["containerDefinitions"][0]["environment"].append({"name": "A"})
+    copied["cpu"] = "2048"
+    assert task_definition == {
+        "containerDefinitions": [
+            {"name": "prefect", "environment": [{"name": "FOO", "value": "BAR"}]}
+        ],
+        "cpu": "1024",
+        "revision": 1,
+    }
+
+
+@pytest.mark.parametrize(
+    "taskdef_1,taskdef_2,expected",
+    [
+        (
+            {"containerDefinitions": [{"name": "prefect"}]},
+            {
+                "containerDefinitions": [{"name": "prefect", "essential": True}],
+                "networkMode": "bridge",
+                "taskDefinitionArn": "arn:aws:ecs:us-east-1:123456789012:test",
+                "revision": 1,
+            },
+            True,
+        ),
+        (
+            {"containerDefinitions": [{"name": "prefect", "environment": []}]},
+            {"containerDefinitions": [{"name": "prefect", "cpu": None}], "cpu": ""},
+            True,
+        ),
+        (
+            {"containerDefinitions": [{"name": "prefect"}]},
+            {"containerDefinitions": [{"name": "prefect"}], "networkMode": "awsvpc"},
+            False,
+        ),
+        (
+            {"containerDefinitions": [{"name": "prefect", "command": ["a"]}]},
+            {"containerDefinitions": [{"name": "prefect", "command": ["b"]}]},
+            False,
+        ),
+        (
+            {"containerDefinitions": [{"name": "prefect"}]},
+            {"containerDefinitions": [{"name": "prefect"}, {"name": "sidecar"}]},
+            False,
+        ),
+    ],
+)
+def test_task_definitions_equal(taskdef_1, taskdef_2, expected):
+    original_1, original_2 = deepcopy(taskdef_1), deepcopy(taskdef_2)
+
+    worker = ECSWorker(work_pool_name="test")
+    assert worker._task_definitions_equal(taskdef_1, taskdef_2) is expected
+
+    # The task definitions should not be modified by the comparison
+    assert taskdef_1 == original_1
+    assert taskdef_2 == original_2
+
+
+def test_retrieve_task_definition_is_not_cached():
+    # A revision can be deregistered outside of this worker at any time
+    arn = "arn:aws:ecs:us-east-1:123456789012:task-definition/prefect:1"
+    ecs_client = MagicMock()
+    ecs_client.describe_task_definition.side_effect = [
+        {"taskDefinition": {"taskDefinitionArn": arn, "status": "ACTIVE"}},
+        {"taskDefinition": {"taskDefinitionArn": arn, "status": "INACTIVE"}},
+    ]
+    worker = ECSWorker(work_pool_name="test")
+
+    worker._retrieve_task_definition(MagicMock(), ecs_client, arn)
+    task_definition = worker._retrieve_task_definition(MagicMock(), ecs_client, arn)
+
+    assert task_definition["status"] == "INACTIVE"
+    assert ecs_client.describe_task_definition.call_count == 2
+
+
+def test_set_bounded_cache_item_evicts_least_recently_set_items():
+    cache = {}
+    for key in "abc":
+        _set_bounded_cache_item(cache, key, key.upper(), max_size=3)
+
+    # Setting an existing key moves it to the end
+    _set_bounded_cache_item(cache, "a", "A", max_size=3)
+    _set_bounded_cache_item(cache, "d", "D", max_size=3)
+
+    assert cache == {"c": "C", "a": "A", "d": "D"}
+    assert list(cache) == ["c", "a", "d"]
+
+
+@pytest.mark.usefixtures("ecs_mocks")
+async def test_network_configuration_is_cached_per_vpc(
+    aws_credentials: AwsCredentials,
+):
+    configuration = await construct_configuration(aws_credentials=aws_credentials)
+    ec2_client = MagicMock()
+    ec2_client.describe_vpcs.return_value = {"Vpcs": [{"VpcId": "vpc-1"}]}
+    ec2_client.describe_subnets.return_value = {"Subnets": [{"SubnetId": "subnet-1"}]}
+
+    worker = ECSWorker(work_pool_name="test")
+    worker._get_client = MagicMock(return_value=ec2_client)
+
+    network_configuration = worker._load_network_configuration(None, configuration)
+    # Changes to the returned configuration should not affect the cache
+    network_configuration["awsvpcConfiguration"]["subnets"].append("subnet-2")
+
+    assert worker._load_network_configuration(None, configuration) == {
+        "awsvpcConfiguration": {
+            "subnets": ["subnet-1"],
+            "assignPublicIp": "ENABLED",
+            "securityGroups": [],
+        }
+    }
+    ec2_client.describe_vpcs.assert_called_once()
+
+    worker._load_network_configuration("vpc-1", configuration)
+    assert ec2_client.describe_vpcs.call_count == 2